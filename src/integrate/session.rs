@@ -39,8 +39,9 @@ impl Session {
 
         let root_str = root.display().to_string();
 
-        // Convert absolute paths to relative paths
-        let selected: Vec<String> = selected_paths
+        // Convert absolute paths to relative paths, sorted so that saving the
+        // same selection always produces the same file
+        let mut selected: Vec<String> = selected_paths
             .iter()
             .filter_map(|p| {
                 p.strip_prefix(root)
@@ -48,6 +49,7 @@ impl Session {
                     .map(|rel| rel.display().to_string())
             })
             .collect();
+        selected.sort_unstable();
 
         let focus = focus_path.and_then(|p| {
             p.strip_prefix(root)
@@ -88,7 +90,16 @@ impl Session {
         let path = Self::session_path(root, name);
         let json = serde_json::to_string_pretty(self)
             .map_err(|e| io::Error::new(io::ErrorKind::InvalidData, e))?;
-        fs::write(path, json)
+
+        // Write to a sibling temp file and rename over the target so an
+        // interrupted save never leaves a truncated session behind.
+        let mut tmp_name = path.as_os_str().to_owned();
+        tmp_name.push(".tmp");
+        let tmp_path = PathBuf::from(tmp_name);
+        fs::write(&tmp_path, json)?;
+        fs::rename(&tmp_path, &path).inspect_err(|_| {
+            let _ = fs::remove_file(&tmp_path);
+        })
     }
 
     /// Load session from file
@@ -274,4 +285,40 @@ mod tests {
         assert!(loaded_selected.contains(&file1));
         assert_eq!(loaded_focus, Some(file1));
     }
+
+    #[test]
+    fn test_session_save_overwrites_without_temp_file() {
+        let dir = tempdir().unwrap();
+        let root = dir.path();
+
+        let file1 = root.join("a.txt");
+        let file2 = root.join("b.txt");
+        fs::write(&file1, "a").unwrap();
+        fs::write(&file2, "b").unwrap();
+
+        let mut selected = HashSet::new();
+        selected.insert(file1.clone());
+        save_session(root, &selected, None).unwrap();
+
+        selected.insert(file2.clone());
+        save_session(root, &selected, None).unwrap();
+
+        let (loaded_selected, _) = load_session(root).unwrap();
+        assert_eq!(loaded_selected.len(), 2);
+        assert!(!root.join(".fileview-session.json.tmp").exists());
+    }
+
+    #[test]
+    fn test_session_selected_paths_sorted() {
+        let dir = tempdir().unwrap();
+        let root = dir.path();
+
+        let mut selected = HashSet::new();
+        for name in ["c.txt", "a.txt", "b.txt"] {
+            selected.insert(root.join(name));
+        }
+
+        let session = Session::new(root, &selected, None);
+        assert_eq!(session.selected_paths, vec!["a.txt", "b.txt", "c.txt"]);
+    }
 }